@@ -5,6 +5,8 @@ Gitea -> GitHub migration (HTTPS).
 - Clone (mirror) from Gitea using your current credentials (e.g., bask185).
 - Push via git.exe under a specific GitHub user (default: sebastiaan-knippels).
 - No global/system writes; repo-local config only. Push uses inline -c overrides to defeat VS Code AskPass and global helpers.
+- With --helper gcm the PAT is also kept in a git credential-cache daemon on a socket private to
+  this run, so a batch reads GCM only once; the daemon is stopped when the script ends.
 
 JSON format (gitea_repos.json):
 [
@@ -15,29 +17,43 @@ JSON format (gitea_repos.json):
 Requirements:
 - git installed
 - gh installed (only needed for repo creation and when using gh as credential helper)
+- orjson (optional; used to parse the JSON when installed)
 """
 
 import argparse
 import json
 import os
 import re
-import shutil
 import stat
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson  # optional: parses the JSON bytes directly
+except ImportError:
+    orjson = None
+
 # ---------- Settings ----------
 ALLOWED_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+GH_API_CACHE = "1h"  # gh's own response cache for the identity lookup
+CREDENTIAL_CACHE_TIMEOUT = 3600  # upper bound for the cached PAT if the run dies before stopping the daemon
+RMTREE_WORKERS = 8  # parallel unlinks when cleaning up a mirror clone
+PENDING_DELETE_SUFFIX = ".pending_delete"  # mirrors renamed aside, being deleted in the background
+PENDING_DELETE_WAIT = 120  # seconds to wait for background deletes before exiting
 
 # ---------- Small utils ----------
 def log(msg: str) -> None:
     print(msg, flush=True)
 
-def run(cmd, *, cwd=None, check=True, env=None, echo=True):
+def run(cmd, *, cwd=None, check=True, env=None, echo=True, stdin=None):
     if echo:
         print(f"\n$ {' '.join(cmd)}", flush=True)
-    subprocess.run(cmd, cwd=cwd, check=check, env=env)
+    subprocess.run(cmd, cwd=cwd, check=check, env=env, stdin=stdin)
 
 def run_quiet(cmd, *, cwd=None) -> bool:
     try:
@@ -48,42 +64,157 @@ def run_quiet(cmd, *, cwd=None) -> bool:
         return False
 
 def gh_repo_exists(full_name: str) -> bool:
-    return run_quiet(["gh", "repo", "view", full_name])
+    # Not cached: gh would also cache the 404, and the repo is created right after a miss
+    return run_quiet(["gh", "api", "--silent",
+                      "-H", "Accept: application/vnd.github+json", f"/repos/{full_name}"])
 
 def gh_whoami() -> str:
     try:
         out = subprocess.check_output(
-            ["gh", "api", "user", "-H", "Accept: application/vnd.github+json", "-q", ".login"],
+            ["gh", "api", "--cache", GH_API_CACHE, "/user",
+             "-H", "Accept: application/vnd.github+json", "-q", ".login"],
             text=True
         ).strip()
         return out
     except Exception:
         return ""
 
-def force_remove_readonly(func, path, _exc):
+if os.name == "nt":
+    import ctypes
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.DeleteFileW.argtypes = [ctypes.c_wchar_p]
+
+    def unlink_file(path: str) -> None:
+        # DeleteFileW directly: one syscall, no attribute probe before the delete
+        if not _kernel32.DeleteFileW(path):
+            raise ctypes.WinError(ctypes.get_last_error())
+else:
+    unlink_file = os.unlink
+
+def remove_force(func, path: str) -> None:
+    """Remove a file or empty dir; if it is read-only (git objects are), make it writable and retry once."""
     try:
+        func(path)
+    except PermissionError:
         os.chmod(path, stat.S_IWRITE)
         func(path)
-    except Exception:
-        raise
 
 def rmtree_force(p: Path):
-    if p.exists():
-        shutil.rmtree(p, onerror=force_remove_readonly)
+    """
+    Delete a directory tree. Files are unlinked on a thread pool while the tree
+    is being scanned; directories are removed afterwards, deepest first.
+    """
+    if not p.exists():
+        return
+    dirs = []
+    with ThreadPoolExecutor(max_workers=RMTREE_WORKERS) as pool:
+        jobs = []
+        stack = [str(p)]
+        while stack:
+            d = stack.pop()
+            dirs.append(d)
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        jobs.append(pool.submit(remove_force, unlink_file, entry.path))
+        for job in jobs:
+            job.result()  # re-raise the first failure
+    for d in reversed(dirs):
+        remove_force(os.rmdir, d)
+
+pending_deletes = []
+
+def delete_pending(p: Path) -> None:
+    try:
+        rmtree_force(p)
+    except (RuntimeError, OSError):
+        # RuntimeError: interpreter shutdown (PENDING_DELETE_WAIT ran out), the thread
+        # pool refuses new work. OSError: something in the tree could not be removed.
+        # Give up quietly either way; the next run removes the .pending_delete folder.
+        pass
+
+def delete_in_background(p: Path) -> None:
+    t = threading.Thread(target=delete_pending, args=(p,), name=f"delete {p.name}", daemon=True)
+    t.start()
+    pending_deletes.append(t)
+
+def discard_tree(p: Path) -> None:
+    """
+    Get p out of the way immediately: move it (a single rename) into a fresh,
+    uniquely named <name>.<random>.pending_delete folder next to it and delete
+    that folder on a background thread.
+    """
+    if not p.exists():
+        return
+    pending = Path(tempfile.mkdtemp(dir=p.parent, prefix=f"{p.name}.", suffix=PENDING_DELETE_SUFFIX))
+    try:
+        os.replace(p, pending / p.name)
+    except OSError:
+        pending.rmdir()
+        rmtree_force(p)  # cannot rename (e.g. locked by a scanner): delete in place
+        return
+    delete_in_background(pending)
+
+def wait_pending_deletes(timeout: float = PENDING_DELETE_WAIT) -> None:
+    deadline = time.monotonic() + timeout
+    for t in pending_deletes:
+        t.join(max(0.0, deadline - time.monotonic()))
 
 def ensure_work_clean(work_root: Path, repo_name: str) -> Path:
     bare = work_root / f"{repo_name}.git"
-    rmtree_force(bare)
+    discard_tree(bare)
     work_root.mkdir(exist_ok=True)
     return bare
 
+def write_push_config(bare: Path, remote_url: str, push_user: str) -> None:
+    """
+    Append the 'github' remote and the repo-local credential settings to the
+    config of a freshly mirror-cloned bare repo in one write, instead of one
+    git.exe call per key. The clone only has 'origin', so nothing needs removing.
+    """
+    block = (
+        '[remote "github"]\n'
+        f"\turl = {remote_url}\n"
+        "\tfetch = +refs/heads/*:refs/remotes/github/*\n"
+        # Use Windows Git Credential Manager and pin the desired GitHub user
+        "[credential]\n"
+        "\thelper = manager\n"
+        f"\tusername = {push_user}\n"
+        # Let gh provide the token for github.com (highest priority)
+        '[credential "https://github.com"]\n'
+        "\thelper = !gh auth git-credential\n"
+    )
+    with (bare / "config").open("a", encoding="utf-8") as f:
+        f.write(block)
+
+credential_cache_dir = None  # private (0700) folder for this run's credential-cache socket
+
+def credential_cache_socket() -> str:
+    global credential_cache_dir
+    if credential_cache_dir is None:
+        credential_cache_dir = Path(tempfile.mkdtemp(prefix="hm-migrate-"))
+    return (credential_cache_dir / "socket").as_posix()
+
+def stop_credential_cache() -> None:
+    """Stop this run's credential-cache daemon, if one was used, so the PAT does not outlive the run."""
+    if credential_cache_dir is None:
+        return
+    subprocess.run(["git", "credential-cache", "--socket", credential_cache_socket(), "exit"],
+                   check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        rmtree_force(credential_cache_dir)
+    except OSError:
+        pass
+
 # ---------- Push helper ----------
 def push_mirror_force(temp_dir: Path, remote_name: str, push_user: str, use_gh_helper: bool):
     """
     Mirror push using git.exe with inline -c overrides.
     - Disables VS Code AskPass completely (core.askpass= and no GIT_ASKPASS/SSH_ASKPASS env).
     - Forces credential.username to desired user.
-    - For github.com, uses gh helper or leaves manager as fallback (but still inline overrides).
+    - For github.com, uses gh helper or the credential cache backed by manager (still inline overrides).
     """
     env = os.environ.copy()
     env["GIT_TERMINAL_PROMPT"] = "0"
@@ -107,29 +238,142 @@ def push_mirror_force(temp_dir: Path, remote_name: str, push_user: str, use_gh_h
 
         # drop any stale/bad headers that might carry auth
         "-c", "http.https://github.com/.extraheader=",
+
+        # send large packs in one POST instead of falling back to chunked encoding
+        "-c", "http.postBuffer=524288000",
+
+        # let pack-objects use all cores and more memory while building the push pack
+        "-c", "pack.threads=0", "-c", "pack.windowMemory=1g", "-c", "pack.deltaCacheSize=1g",
     ]
 
     if use_gh_helper:
         # make git.exe ask gh.exe for a token for github.com
         cmd += ["-c", "credential.https://github.com.helper=!gh auth git-credential"]
     else:
-        # rely on Windows Git Credential Manager (stored PAT for this user/host)
-        cmd += ["-c", "credential.helper=manager"]
+        # in-memory cache (private to this run) first, Windows Git Credential Manager (stored PAT
+        # for this user/host) as fallback; git stores the PAT in the cache after the first push
+        cache = f"cache --timeout={CREDENTIAL_CACHE_TIMEOUT} --socket='{credential_cache_socket()}'"
+        cmd += ["-c", f"credential.helper={cache}",
+                "-c", "credential.helper=manager"]
 
     cmd += ["push", "--mirror", remote_name]
 
     print("\n$ " + " ".join(cmd))
     subprocess.run(cmd, check=True, env=env)
 
+# ---------- Per-repo steps ----------
+def clone_mirror(entry: dict, work_root: Path, background: bool = False) -> Path:
+    """
+    Step 1: mirror-clone one repo from Gitea into <work_root>/<name>.git.
+    A background clone runs while another repo is pushed: it must not prompt
+    (no stdin, no terminal/SSH prompts; it fails instead) and prints nothing but
+    errors, not even its step banner (migrate_all prints that when it takes the result).
+    """
+    name = entry["name"]
+    bare = ensure_work_clean(work_root, name)  # <repo>.git (bare)
+    cmd = ["git", "clone", "--mirror", entry["ssh"], str(bare)]
+    if not background:
+        log(f"\n=== [{name}] Step 1: Mirror-clone from Gitea (bare) ===")
+        run(cmd)
+        return bare
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    if "GIT_SSH" not in env and "GIT_SSH_COMMAND" not in env:
+        env["GIT_SSH_COMMAND"] = "ssh -o BatchMode=yes"
+    run(cmd[:2] + ["--quiet"] + cmd[2:], env=env, stdin=subprocess.DEVNULL, echo=False)
+    return bare
+
+def publish_mirror(args, name: str, bare: Path) -> None:
+    """Steps 2-4: ensure the GitHub repo exists, configure the mirror and push it."""
+    full_name = f"{args.org}/{name}"
+    # IMPORTANT: remote URL with the desired push user embedded to avoid accidental other usernames
+    https_url_with_user = f"https://{args.user}@github.com/{full_name}.git"
+
+    # --- Step 2: ensure GitHub repo exists (private) ---
+    log(f"\n=== [{name}] Step 2: Ensure GitHub repo exists (private) ===")
+    if gh_repo_exists(full_name):
+        print(f"GitHub repo already exists: https://github.com/{full_name}")
+    else:
+        # create via gh; if you don't want this, create manually and comment out next line
+        run(["gh", "repo", "create", full_name, "--private"])
+        print(f"✓ Created: https://github.com/{full_name}")
+
+    # --- Step 3: add/verify remote and set EXACTLY the requested local configs ---
+    log(f"\n=== [{name}] Step 3: Configure remote and set requested repo-local credentials ===")
+
+    # Remote: explicitly set URL WITH the desired user to avoid VS Code prompting with the wrong one,
+    # plus repo-local credential.helper=manager, credential.username and the gh helper for github.com
+    write_push_config(bare, https_url_with_user, args.user)
+    run(["git", "-C", str(bare), "remote", "-v"])
+
+    # --- Step 4: mirror push via git.exe (inline -c; AskPass disabled; hard username) ---
+    log(f"\n=== [{name}] Step 4: Push (mirror) to GitHub — forced, non-interactive ===")
+    push_mirror_force(temp_dir=bare,
+                      remote_name="github",
+                      push_user=args.user,
+                      use_gh_helper=(args.helper == "gh"))
+
+    print(f"\n✓ Mirror push completed: {name}")
+    print(f"Repo URL: https://github.com/{full_name}")
+
+def migrate_all(args, entries: list, work_root: Path) -> list:
+    """
+    Migrate the entries in order and return the names that failed.
+    The clone of the next repo (Gitea) runs on a worker thread while the
+    current one is pushed (GitHub); each repo has its own <name>.git folder,
+    so entries must be unique.
+    """
+    failed = []
+    # leftovers of an earlier run that exited before its background deletes finished
+    if work_root.is_dir():
+        for stale in work_root.glob(f"*{PENDING_DELETE_SUFFIX}"):
+            delete_in_background(stale)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        next_clone = None
+        for i, entry in enumerate(entries):
+            name = entry["name"]
+            clone, next_clone = next_clone, None
+            try:
+                if clone is None:
+                    bare = clone_mirror(entry, work_root)
+                else:
+                    try:
+                        bare = clone.result()
+                        log(f"\n=== [{name}] Step 1: Mirror-clone from Gitea (bare) — done in the background ===")
+                    except subprocess.CalledProcessError:
+                        # The background clone may not prompt (SSH passphrase, host key);
+                        # nothing else is running now, so retry it in the foreground.
+                        log(f"\n[WARN] [{name}] Background clone failed; retrying in the foreground.")
+                        bare = clone_mirror(entry, work_root)
+                # clone the next repo while this one is pushed
+                next_clone = (pool.submit(clone_mirror, entries[i + 1], work_root, True)
+                              if i + 1 < len(entries) else None)
+                publish_mirror(args, name, bare)
+            except subprocess.CalledProcessError as e:
+                print(f"\n[ERROR] [{name}] Command failed.")
+                print(f"Exit code: {e.returncode}")
+                print("Hints:")
+                print(f" - If using --helper gh: ensure 'gh auth status -h github.com' shows '{args.user}' "
+                      "and SSO is authorized (gh auth refresh -h github.com -s repo,workflow).")
+                print(" - If using --helper gcm: ensure a valid PAT for github.com is stored for that username.")
+                failed.append(name)
+            finally:
+                log(f"\n=== [{name}] Step 5: Cleanup temporary mirror folder (in the background) ===")
+                discard_tree(work_root / f"{name}.git")
+    return failed
+
 # ---------- CLI ----------
 def parse_args():
-    p = argparse.ArgumentParser(description="Migrate a single repo from Gitea to GitHub.")
+    p = argparse.ArgumentParser(description="Migrate repos from Gitea to GitHub.")
     p.add_argument("--json", default="gitea_repos.json", help="Path to JSON list of repos.")
     p.add_argument("--org", default="Holland-Mechanics", help="Target GitHub org (canonical caps).")
     p.add_argument("--user", default="sebastiaan-knippels", help="GitHub username to push under.")
     p.add_argument("--helper", choices=["gh", "gcm"], default="gh",
                    help="Credential provider for github.com during push: gh (OAuth via gh.exe) or gcm (Windows GCM/PAT).")
-    p.add_argument("--workdir", default=".mirror_work", help="Temp working folder for bare clone.")
+    p.add_argument("--workdir", default=".mirror_work", help="Temp working folder for bare clones.")
+    which = p.add_mutually_exclusive_group()
+    which.add_argument("--all", action="store_true", help="Migrate every repo in the JSON list.")
+    which.add_argument("--names", help="Comma-separated repo names to migrate (no prompt).")
     return p.parse_args()
 
 # ---------- Main ----------
@@ -142,118 +386,73 @@ def main():
         print(f"[ERROR] Cannot find '{json_path}'."); sys.exit(1)
 
     try:
-        items = json.loads(json_path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            items = orjson.loads(json_path.read_bytes())
+        else:
+            items = json.loads(json_path.read_text(encoding="utf-8"))
     except Exception as e:
         print(f"[ERROR] Failed to parse JSON: {e}"); sys.exit(1)
     if not isinstance(items, list):
         print("[ERROR] JSON must be a list of objects."); sys.exit(1)
 
     names = sorted({i["name"] for i in items if isinstance(i, dict) and i.get("name")})
-    print("=== Available repositories from JSON ===")
-    for n in names:
-        print(f" - {n}")
-    print()
-
-    target = input("Type the repository name to migrate: ").strip()
-    if not target:
-        print("[ERROR] Name cannot be empty."); sys.exit(1)
-    if not ALLOWED_RE.match(target):
-        print("[ERROR] Invalid name. Allowed: letters, numbers, underscore, hyphen, dot."); sys.exit(1)
-    if target not in names:
-        print("[ERROR] Name not found in JSON list."); sys.exit(1)
-
-    entry = next((x for x in items if x.get("name") == target), None)
-    if not entry or not entry.get("ssh"):
-        print("[ERROR] Selected repo has no 'ssh' URL in JSON."); sys.exit(1)
-
-    ssh_source = entry["ssh"]
-    work_root = here / args.workdir
-    temp_dir  = ensure_work_clean(work_root, target)  # <repo>.git (bare)
-
-    full_name = f"{args.org}/{target}"
-    # IMPORTANT: remote URL with the desired push user embedded to avoid accidental other usernames
-    https_url_with_user = f"https://{args.user}@github.com/{full_name}.git"
+    if args.all:
+        targets = names
+    elif args.names:
+        # unique, in the given order: two entries would share (and discard) one <name>.git folder
+        targets = list(dict.fromkeys(n.strip() for n in args.names.split(",") if n.strip()))
+    else:
+        print("=== Available repositories from JSON ===")
+        for n in names:
+            print(f" - {n}")
+        print()
+        targets = [input("Type the repository name to migrate: ").strip()]
+
+    entries = []
+    for target in targets:
+        if not target:
+            print("[ERROR] Name cannot be empty."); sys.exit(1)
+        if not ALLOWED_RE.match(target):
+            print(f"[ERROR] Invalid name '{target}'. Allowed: letters, numbers, underscore, hyphen, dot."); sys.exit(1)
+        if target not in names:
+            print(f"[ERROR] Name '{target}' not found in JSON list."); sys.exit(1)
+
+        entry = next((x for x in items if isinstance(x, dict) and x.get("name") == target), None)
+        if not entry or not entry.get("ssh"):
+            print(f"[ERROR] Repo '{target}' has no 'ssh' URL in JSON."); sys.exit(1)
+        entries.append(entry)
+    if not entries:
+        print("[ERROR] No repositories selected."); sys.exit(1)
+
+    # Verify the gh identity once for the whole run
+    if args.helper == "gh":
+        log("\n=== Verify gh identity (only when --helper gh) ===")
+        who = gh_whoami()
+        if who != args.user:
+            print(f"[ERROR] gh is logged in as '{who or 'UNKNOWN'}', expected '{args.user}'.")
+            print("Run: gh auth login -h github.com  (and authorize SSO if required)")
+            sys.exit(1)
+        # No `gh auth setup-git`/`status` here: the push passes gh as helper inline (-c)
 
+    work_root = here / args.workdir
     try:
-        # --- Step 1: mirror-clone from Gitea (bare) ---
-        log("\n=== Step 1: Mirror-clone from Gitea (bare) ===")
-        run(["git", "clone", "--mirror", ssh_source, str(temp_dir)])
-
-        # --- Step 2: ensure GitHub repo exists (private) ---
-        log("\n=== Step 2: Ensure GitHub repo exists (private) ===")
-        if gh_repo_exists(full_name):
-            print(f"GitHub repo already exists: https://github.com/{full_name}")
-        else:
-            # create via gh; if you don't want this, create manually and comment out next line
-            run(["gh", "repo", "create", full_name, "--private"])
-            print(f"✓ Created: https://github.com/{full_name}")
-
-        # --- Step 3: verify gh identity when using gh helper ---
-        use_gh_helper = (args.helper == "gh")
-        if use_gh_helper:
-            log("\n=== Step 3: Verify gh identity (only when --helper gh) ===")
-            who = gh_whoami()
-            if who != args.user:
-                print(f"[ERROR] gh is logged in as '{who or 'UNKNOWN'}', expected '{args.user}'.")
-                print("Run: gh auth login -h github.com  (and authorize SSO if required)")
-                sys.exit(1)
-            # Make sure gh wires itself into git (does not touch system, only Git's notion)
-            run(["gh", "auth", "setup-git"])
-            run(["gh", "auth", "status", "--hostname", "github.com"])
-
-        # --- Step 4: add/verify remote and set EXACTLY the requested local configs ---
-        log("\n=== Step 4: Configure remote and set requested repo-local credentials ===")
-
-        # Remote: explicitly set URL WITH the desired user to avoid VS Code prompting with the wrong one
-        run(["git", "-C", str(temp_dir), "remote", "remove", "github"], check=False)
-        run(["git", "-C", str(temp_dir), "remote", "add", "github", https_url_with_user])
-        run(["git", "-C", str(temp_dir), "remote", "set-url", "github", https_url_with_user])
-        run(["git", "-C", str(temp_dir), "remote", "-v"])
-
-        # === YOUR THREE LINES, EXACTLY AFTER CHANGING THE REMOTE ===
-        # Use Windows Git Credential Manager
-        run(["git", "-C", str(temp_dir), "config", "--local", "credential.helper", "manager"])
-        # Pin the desired GitHub user in this repo
-        run(["git", "-C", str(temp_dir), "config", "--local", "credential.username", args.user])
-        # Let gh provide the token for github.com (highest priority)
-        # (No quoting required here; subprocess does not use a shell.)
-        run(["git", "-C", str(temp_dir), "config", "--local",
-             "credential.https://github.com.helper", "!gh auth git-credential"])
-        # Clean any bad extra headers if they ever existed
-        subprocess.run(["git", "-C", str(temp_dir), "config", "--local",
-                        "--unset-all", "http.https://github.com/.extraheader"], check=False)
-
-        # --- Step 5: mirror push via git.exe (inline -c; AskPass disabled; hard username) ---
-        log("\n=== Step 5: Push (mirror) to GitHub — forced, non-interactive ===")
-        push_mirror_force(temp_dir=temp_dir,
-                          remote_name="github",
-                          push_user=args.user,
-                          use_gh_helper=use_gh_helper)
-
-        print("\n✓ Mirror push completed.")
-        print(f"Repo URL: https://github.com/{full_name}")
-
-    except subprocess.CalledProcessError as e:
-        print("\n[ERROR] Command failed.")
-        print(f"Exit code: {e.returncode}")
-        print("Hints:")
-        print(" - If using --helper gh: ensure 'gh auth status -h github.com' shows '{args.user}' "
-              "and SSO is authorized (gh auth refresh -h github.com -s repo,workflow).")
-        print(" - If using --helper gcm: ensure a valid PAT for github.com is stored for that username.")
-        sys.exit(1)
+        failed = migrate_all(args, entries, work_root)
+        if failed:
+            print(f"\n[ERROR] Migration failed for: {', '.join(failed)}")
+            sys.exit(1)
 
+        print("\n=== Done ===")
+        print("Branches and tags should now be visible.")
     finally:
-        log("\n=== Step 6: Cleanup temporary mirror folder ===")
-        rmtree_force(temp_dir)
+        stop_credential_cache()
+        # Results are printed first; only then wait for the mirrors to finish deleting.
+        # (Done here rather than atexit: thread pools refuse new work once shutdown starts.)
+        wait_pending_deletes()
         try:
             work_root.rmdir()
-            print(f"Removed empty folder: {work_root}")
         except OSError:
-            rmtree_force(work_root)
-        print("Cleanup completed.")
-
-    print("\n=== Done ===")
-    print("Branches and tags should now be visible.")
+            if work_root.exists():
+                print(f"[WARN] Temporary files remain in {work_root}; the next run removes them.")
 
 if __name__ == "__main__":
     main()
@@ -31,13 +31,13 @@ Requirements:
 """
 
 import os
-import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 # ----------------------------
 # Utilities
@@ -55,6 +55,42 @@ def run(cmd: List[str], cwd: Optional[Path] = None, check: bool = True) -> subpr
         check=check
     )
 
+def run_stream(cmd: List[str], cwd: Optional[Path] = None,
+               stdin_text: Optional[str] = None) -> Iterator[str]:
+    """
+    Run a process and yield its stdout line by line while it is still running.
+    stderr is captured like run() does; CalledProcessError (with stderr) is raised
+    once the output is exhausted if exit != 0. Stopping the iteration early kills the process.
+    """
+    # stderr goes to a temp file, not a pipe: an unread full pipe could block git
+    with tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace") as err:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd) if cwd else None,
+            text=True,
+            stdin=subprocess.PIPE if stdin_text is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=err,
+            bufsize=1
+        )
+        if stdin_text is not None:
+            # git reads all of stdin before it starts writing, so this cannot deadlock
+            proc.stdin.write(stdin_text)
+            proc.stdin.close()
+        finished = False
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+            finished = True
+        finally:
+            if not finished:
+                proc.kill()
+            proc.stdout.close()
+            returncode = proc.wait()
+        if returncode:
+            err.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=err.read())
+
 def ask(prompt: str, default: Optional[str] = None) -> str:
     """
     Interactive prompt (single line). Empty input returns default if provided.
@@ -86,10 +122,18 @@ def ask_yes_no(prompt: str, default_yes: bool = True) -> bool:
 # Version/tag helpers
 # ----------------------------
 
-SEMVER_TAG_RE = re.compile(r"^v\d+\.\d+\.\d+$")
+def is_semver_tag(tag: str) -> bool:
+    """
+    True for tags of the form v1.2.3. A prefix check plus split/isdecimal is
+    cheaper than a regex match for the many short tag names of a big repo.
+    """
+    if tag[:1] != "v":
+        return False
+    parts = tag[1:].split(".")
+    return len(parts) == 3 and all(p.isdecimal() for p in parts)
 
 def validate_version(tag: str) -> None:
-    if not SEMVER_TAG_RE.match(tag):
+    if not is_semver_tag(tag):
         raise SystemExit("ERROR: Version must match syntax v1.2.3")
 
 # ----------------------------
@@ -124,8 +168,21 @@ def git_repo_name() -> str:
     return git_repo_root().name
 
 def git_has_changes() -> bool:
-    cp = run(["git", "status", "--porcelain"], check=True)
-    return bool(cp.stdout.strip())
+    """
+    True if the work tree or index differs from HEAD, or there are untracked files.
+    `git diff --quiet` stops at the first difference; the untracked listing is only
+    read up to its first entry.
+    """
+    if run(["git", "diff", "--quiet"], check=False).returncode != 0:
+        return True
+    if run(["git", "diff", "--cached", "--quiet"], check=False).returncode != 0:
+        return True
+    untracked = run_stream(["git", "ls-files", "--others", "--exclude-standard",
+                            "--directory", "--no-empty-directory"])
+    try:
+        return next(untracked, None) is not None
+    finally:
+        untracked.close()
 
 def git_add_all() -> None:
     run(["git", "add", "-A"])
@@ -167,21 +224,80 @@ def git_push_with_tags() -> None:
     run(["git", "push"])
     run(["git", "push", "--tags"])
 
-def git_tag_list_sorted_desc() -> List[str]:
-    cp = run(["git", "tag", "--sort=-creatordate"])
-    tags = [t.strip() for t in cp.stdout.splitlines() if t.strip()]
-    return [t for t in tags if SEMVER_TAG_RE.match(t)]
-
-def tag_date(tag: str) -> str:
-    cp = run(["git", "log", "-1", "--format=%ad", "--date=short", tag])
-    return cp.stdout.strip()
+def git_tag_list_sorted_desc() -> List[Tuple[str, str]]:
+    """
+    Return (tag, commit) pairs for all version tags, newest tag first.
+    Annotated tags are peeled to the commit they point at.
+    """
+    tags = []
+    for ln in run_stream(["git", "for-each-ref", "--sort=-creatordate",
+                          "--format=%(refname:strip=2)%00%(*objectname)%00%(objectname)", "refs/tags"]):
+        tag, peeled, obj = ln.split("\0")
+        if is_semver_tag(tag):
+            tags.append((tag, peeled or obj))
+    return tags
+
+def tag_history(tags: List[Tuple[str, str]]) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    Read the history of all tags with a single `git log` and return
+    (tag -> date, tag -> non-merge commit subjects).
+    Each tag gets the commits of `git log <previous tag>..<tag>` (the oldest
+    tag gets its whole history); the ranges are computed from the parent graph.
+    """
+    parents: Dict[str, List[str]] = {}
+    commit_dates: Dict[str, str] = {}
+    log_order: List[Tuple[str, str]] = []  # (commit, subject) of non-merge commits, in log order
+    commits = list(dict.fromkeys(commit for _, commit in tags))
+    lines = run_stream(
+        ["git", "log", "--stdin", "--date=short", "--pretty=format:%H%x00%P%x00%ad%x00%s"],
+        stdin_text="".join(f"{c}\n" for c in commits),
+    ) if commits else []
+    for ln in lines:
+        if not ln:
+            continue
+        commit, parent_list, date, subject = ln.split("\0", 3)
+        parents[commit] = parent_list.split()
+        commit_dates[commit] = date
+        if len(parents[commit]) <= 1:
+            log_order.append((commit, subject.strip()))
+
+    def walk(start: str, stop: Set[str]) -> Tuple[Set[str], Set[str]]:
+        """Commits reachable from start without entering stop, plus the stop commits that were hit."""
+        seen: Set[str] = set()
+        hit: Set[str] = set()
+        todo = [start]
+        while todo:
+            c = todo.pop()
+            if c in stop:
+                hit.add(c)
+            elif c not in seen and c in parents:
+                seen.add(c)
+                todo.extend(parents[c])
+        return seen, hit
+
+    # Oldest tag first: `reach` is everything reachable from the previous tag,
+    # which is closed under ancestry, so walking a tag while stopping at `reach`
+    # yields exactly the previous..tag range.
+    owners: Dict[str, List[str]] = {}
+    reach: Set[str] = set()
+    prev_commit = None
+    for tag, commit in reversed(tags):
+        new, hit = walk(commit, reach)
+        for c in new:
+            owners.setdefault(c, []).append(tag)
+        if prev_commit is None or prev_commit in hit:
+            reach |= new  # the previous tag is an ancestor: extend its set in place
+        else:
+            reach = walk(commit, set())[0]
+        prev_commit = commit
 
-def commits_between(a_excl: Optional[str], b_incl: str) -> List[str]:
-    rev = b_incl if a_excl is None else f"{a_excl}..{b_incl}"
-    fmt = "%s"
-    cp = run(["git", "log", "--no-merges", f"--pretty=format:{fmt}", rev])
-    lines = [ln.strip() for ln in cp.stdout.splitlines() if ln.strip()]
-    return lines
+    dates = {tag: commit_dates[commit] for tag, commit in tags if commit in commit_dates}
+    subjects: Dict[str, List[str]] = {tag: [] for tag, _ in tags}
+    for commit, subject in log_order:
+        if subject:
+            for tag in owners.get(commit, ()):
+                subjects[tag].append(subject)
+    return dates, subjects
 
 # ----------------------------
 # CHANGELOG builder
@@ -191,13 +307,12 @@ def build_changelog() -> str:
     tags = git_tag_list_sorted_desc()
     if not tags:
         return "No tags found.\n"
+    dates, messages = tag_history(tags)
     sections = []
-    for idx, tag in enumerate(tags):
-        prev_tag = tags[idx + 1] if (idx + 1) < len(tags) else None
-        messages = commits_between(prev_tag, tag)
-        date = tag_date(tag) or datetime.utcnow().strftime("%Y-%m-%d")
+    for tag, _ in tags:
+        date = dates.get(tag) or datetime.utcnow().strftime("%Y-%m-%d")
         sec = [f"## {tag} — {date}"]
-        for m in messages:
+        for m in messages[tag]:
             sec.append(f"- {m}")
         sections.append("\n".join(sec))
     return "\n\n".join(sections) + "\n"
@@ -285,14 +400,28 @@ def move_staging_to_public(staging_dir: Path, public_root: Path, machine: str, v
     """
     dest = public_root / machine / version
     dest.mkdir(parents=True, exist_ok=True)
-    for item in staging_dir.iterdir():
+    items = list(staging_dir.iterdir())
+
+    # Directories in the way cannot be overwritten by a rename; clear them in parallel first.
+    stale_dirs = [dest / i.name for i in items
+                  if (dest / i.name).is_dir() and not (dest / i.name).is_symlink()]
+    if stale_dirs:
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(shutil.rmtree, stale_dirs))
+
+    # On the same device a plain rename is enough (files are overwritten atomically);
+    # only a move across devices needs shutil.move's copy + delete.
+    same_device = os.stat(staging_dir).st_dev == os.stat(dest).st_dev
+    for item in items:
         target = dest / item.name
-        if target.exists():
-            if target.is_dir():
-                shutil.rmtree(target)
-            else:
+        if same_device:
+            if item.is_dir() and (target.is_file() or target.is_symlink()):
                 target.unlink()
-        shutil.move(str(item), str(target))
+            os.replace(item, target)
+        else:
+            if target.is_file() or target.is_symlink():
+                target.unlink()
+            shutil.move(str(item), str(target))
     return dest
 
 # ----------------------------
@@ -304,20 +433,27 @@ def edit_message_with_nano(default_text: str = "") -> str:
     Open nano.exe with a temp file, wait until it closes, and return the file content.
     Lines starting with '#' are ignored (like Git commit messages).
     """
-    tmp = Path(tempfile.gettempdir()) / "git_commit_message.txt"
-    tmp.write_text(default_text, encoding="utf-8")
-
+    # Unique temp file (delete=False: nano must be able to open it on Windows), removed afterwards
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt",
+                                     prefix="git_commit_message_", delete=False) as f:
+        f.write(default_text)
     try:
-        subprocess.run(["nano.exe", str(tmp)], check=True)
-    except FileNotFoundError:
-        raise SystemExit("ERROR: nano.exe not found. Ensure it is in PATH or next to this script.")
-    except subprocess.CalledProcessError as e:
-        raise SystemExit(f"ERROR: nano.exe exited with status {e.returncode}")
+        try:
+            subprocess.run(["nano.exe", f.name], check=True)
+        except FileNotFoundError:
+            raise SystemExit("ERROR: nano.exe not found. Ensure it is in PATH or next to this script.")
+        except subprocess.CalledProcessError as e:
+            raise SystemExit(f"ERROR: nano.exe exited with status {e.returncode}")
+
+        # Read back once, ignore comment lines starting with '#'
+        with open(f.name, encoding="utf-8") as fh:
+            data = fh.read()
+    finally:
+        os.unlink(f.name)
 
-    # Read back, ignore comment lines starting with '#'
     msg = "\n".join(
-        line for line in tmp.read_text(encoding="utf-8").splitlines()
-        if not line.strip().startswith("#")
+        line for line in data.splitlines()
+        if not line.lstrip().startswith("#")
     ).strip()
 
     if not msg:
@@ -377,17 +513,21 @@ def main() -> None:
         git_tag_create(version, release_msg)
         print(f"Created tag {version}")
 
-    print("Pushing commit and tags to origin…")
-    try:
-        git_push_with_tags()
-    except subprocess.CalledProcessError as e:
-        out = (e.stdout or "") + (e.stderr or "")
-        if out.strip():
-            print(out.strip())
-        raise SystemExit("ERROR: Failed to push. Resolve and re-run.")
-
-    print("\n>>> Generating CHANGELOG.txt from tags…")
-    changelog = build_changelog()
+    # The changelog only reads local history, so build it while the push waits on the network.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        changelog_job = pool.submit(build_changelog)
+
+        print("Pushing commit and tags to origin…")
+        try:
+            git_push_with_tags()
+        except subprocess.CalledProcessError as e:
+            out = (e.stdout or "") + (e.stderr or "")
+            if out.strip():
+                print(out.strip())
+            raise SystemExit("ERROR: Failed to push. Resolve and re-run.")
+
+        print("\n>>> Generating CHANGELOG.txt from tags…")
+        changelog = changelog_job.result()
     changelog_path = repo_root / "CHANGELOG.txt"
     changelog_path.write_text(changelog, encoding="utf-8")
     print(f"Wrote {changelog_path}")